@@ -3,15 +3,23 @@
 
 import os
 import io
+import csv
+import hmac
 import time
 from datetime import datetime, date
+from functools import lru_cache
 from typing import Optional, Tuple
 
+import numpy as np
 import pandas as pd
-import requests
 import streamlit as st
 import base64
 
+try:
+    import pybase64 as _b64  # SIMD-accelerated drop-in for stdlib base64
+except ImportError:
+    _b64 = base64
+
 # ----------------------------- PAGE CONFIG & THEME ---------------------------
 st.set_page_config(page_title="Le Pari Nordique – Newsletter (Admin)", page_icon="🏅", layout="wide")
 
@@ -32,11 +40,23 @@ st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 # ----------------------------- FLEXIBLE LOGO URL -----------------------------
 GITHUB_LOGO_DIR = "https://raw.githubusercontent.com/Ozzors/Leparinordique/dfab971279f8e3ea44ef2fe3faf3b6caf02fc8e3/assets/"
+
+@st.cache_resource(show_spinner=False)
+def _http_session():
+    # Lazy import: requests is only pulled in when a network call is needed.
+    import requests
+
+    return requests.Session()
+
+@st.cache_data(ttl=3600, show_spinner=False)
 def get_logo_url():
     possible_names = ["logo.png", "logo.jpg", "IMG-20250903-WA0001.jpg", "IMG-20250903-WA0001.png"]
     for name in possible_names:
         url = GITHUB_LOGO_DIR + name
-        r = requests.head(url)
+        try:
+            r = _http_session().head(url, timeout=3, allow_redirects=False)
+        except Exception:
+            continue
         if r.status_code == 200:
             return url
     return None
@@ -79,6 +99,8 @@ GITHUB_BRANCH = st.secrets.get("GITHUB_BRANCH", "main").strip()
 ADMIN_PASSWORD = st.secrets.get("ADMIN_PASSWORD", "").strip()
 
 LOCAL_CSV = "editions.csv"
+CSV_COLUMNS = ["edition_id", "date", "language", "title", "content_md", "published"]
+PARQUET_SNAPSHOT = "editions.parquet"
 
 # ----------------------------- SESSION STATE (admin persist + prompt) --------
 if "is_admin" not in st.session_state:
@@ -87,23 +109,54 @@ if "show_admin_login" not in st.session_state:
     st.session_state["show_admin_login"] = False
 if "admin_ask_stay" not in st.session_state:
     st.session_state["admin_ask_stay"] = False
+st.session_state.setdefault("editions_df", None)
+st.session_state.setdefault("editions_sha", None)
 
 # ----------------------------- GITHUB HELPERS --------------------------------
+@st.cache_resource(show_spinner=False)
+def _gh_session():
+    import requests
+
+    s = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=requests.adapters.Retry(
+            total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)
+        ),
+    )
+    s.mount("https://", adapter)
+    return s
+
+@lru_cache(maxsize=4)
 def _gh_headers(token: str) -> dict:
+    # Safe to share the same dict across calls: requests copies headers.
     return {"Authorization": f"token {token}", "Accept": "application/vnd.github.v3+json"}
 
 def github_get_file(repo: str, path: str, token: str, branch: str = "main") -> Tuple[Optional[bytes], Optional[str]]:
     if not (repo and token):
         return None, None
     url = f"https://api.github.com/repos/{repo}/contents/{path}"
+    # Conditional request: on the common nothing-changed path GitHub answers
+    # 304 with no body, so we skip the download, base64 decode and JSON parse.
+    cache_key = f"_gh_etag::{url}::{branch}"
+    cached = st.session_state.get(cache_key)  # (etag, content, sha)
+    headers = dict(_gh_headers(token))
+    if cached:
+        headers["If-None-Match"] = cached[0]
     try:
-        r = requests.get(url, headers=_gh_headers(token), params={"ref": branch}, timeout=20)
+        r = _gh_session().get(url, headers=headers, params={"ref": branch}, timeout=20)
     except Exception as e:
         st.error(f"Error talking to GitHub: {e}")
         return None, None
+    if r.status_code == 304 and cached:
+        return cached[1], cached[2]
     if r.status_code == 200:
         j = r.json()
         content = base64.b64decode(j["content"].encode())
+        etag = r.headers.get("ETag")
+        if etag:
+            st.session_state[cache_key] = (etag, content, j.get("sha"))
         return content, j.get("sha")
     elif r.status_code == 404:
         return None, None
@@ -118,13 +171,13 @@ def github_put_file(repo: str, path: str, token: str, content_bytes: bytes, mess
     url = f"https://api.github.com/repos/{repo}/contents/{path}"
     payload = {
         "message": message,
-        "content": base64.b64encode(content_bytes).decode("utf-8"),
+        "content": _b64.b64encode(content_bytes).decode("utf-8"),
         "branch": branch,
     }
     if sha:
         payload["sha"] = sha
     try:
-        r = requests.put(url, headers=_gh_headers(token), json=payload, timeout=30)
+        r = _gh_session().put(url, headers=_gh_headers(token), json=payload, timeout=30)
     except Exception as e:
         st.error(f"Error talking to GitHub: {e}")
         return None
@@ -134,56 +187,323 @@ def github_put_file(repo: str, path: str, token: str, content_bytes: bytes, mess
         st.error(f"Failed to write file to GitHub: {r.status_code} — {r.text}")
         return None
 
-# ----------------------------- DATA LOADING / SAVING -------------------------
-@st.cache_data(ttl=30)
-def load_editions_from_github() -> Tuple[pd.DataFrame, Optional[str]]:
-    if not (GITHUB_TOKEN and GITHUB_REPO):
-        return pd.DataFrame(), None
-    content, sha = github_get_file(GITHUB_REPO, GITHUB_PATH, GITHUB_TOKEN, branch=GITHUB_BRANCH)
-    if content is None:
-        return pd.DataFrame(), None
+def github_commit_file(repo: str, path: str, token: str, content_bytes: bytes, message: str, branch: str = "main") -> Optional[str]:
+    # Commit a single file via the Git Data API (blob -> tree -> commit -> ref).
+    # Unlike the Contents API PUT, this needs no prior file SHA, so it cannot
+    # fail on a stale SHA. Returns the new blob SHA (identical to the
+    # Contents-API file SHA) or None on failure.
+    if not (repo and token):
+        st.error("GitHub is not configured (missing token or repo).")
+        return None
+    api = f"https://api.github.com/repos/{repo}"
+    s = _gh_session()
+    headers = _gh_headers(token)
     try:
-        df = pd.read_csv(io.StringIO(content.decode("utf-8")))
+        r = s.post(
+            f"{api}/git/blobs",
+            headers=headers,
+            json={"content": _b64.b64encode(content_bytes).decode("utf-8"), "encoding": "base64"},
+            timeout=30,
+        )
+        r.raise_for_status()
+        blob_sha = r.json()["sha"]
+        r = s.get(f"{api}/git/ref/heads/{branch}", headers=headers, timeout=20)
+        r.raise_for_status()
+        head_sha = r.json()["object"]["sha"]
+        r = s.get(f"{api}/git/commits/{head_sha}", headers=headers, timeout=20)
+        r.raise_for_status()
+        base_tree = r.json()["tree"]["sha"]
+        r = s.post(
+            f"{api}/git/trees",
+            headers=headers,
+            json={"base_tree": base_tree, "tree": [{"path": path, "mode": "100644", "type": "blob", "sha": blob_sha}]},
+            timeout=30,
+        )
+        r.raise_for_status()
+        tree_sha = r.json()["sha"]
+        r = s.post(
+            f"{api}/git/commits",
+            headers=headers,
+            json={"message": message, "tree": tree_sha, "parents": [head_sha]},
+            timeout=30,
+        )
+        r.raise_for_status()
+        commit_sha = r.json()["sha"]
+        r = s.patch(
+            f"{api}/git/refs/heads/{branch}",
+            headers=headers,
+            json={"sha": commit_sha},
+            timeout=30,
+        )
+        r.raise_for_status()
     except Exception as e:
-        st.error(f"Failed to parse CSV from GitHub: {e}")
-        return pd.DataFrame(), sha
-    expected = ["edition_id", "date", "language", "title", "content_md", "published"]
-    for col in expected:
+        st.error(f"Failed to commit file to GitHub: {e}")
+        return None
+    return blob_sha
+
+# ----------------------------- DATA LOADING / SAVING -------------------------
+_PUBLISHED_TRUTHY = frozenset({"true", "1", "yes", "y", "oui"})
+
+def _parse_published(series: pd.Series) -> pd.Series:
+    # Single pass over the raw values; no intermediate lowercased/stripped Series.
+    return series.map(
+        lambda v: v.strip().lower() in _PUBLISHED_TRUTHY
+        if isinstance(v, str)
+        else (pd.notna(v) and bool(v))
+    )
+
+def _parse_dates_lenient(series: pd.Series) -> pd.Series:
+    # Fast ISO path first; values it can't handle (legacy timestamped
+    # entries like "2025-10-21 00:00:00") get a second, format-free pass
+    # instead of being silently coerced to NaT.
+    parsed = pd.to_datetime(series, format="%Y-%m-%d", errors="coerce", cache=True)
+    missed = parsed.isna() & series.notna()
+    if missed.any():
+        parsed[missed] = pd.to_datetime(series[missed], errors="coerce")
+    return parsed
+
+@st.cache_data(
+    show_spinner=False,
+    hash_funcs={pd.DataFrame: lambda d: pd.util.hash_pandas_object(d, index=False).values.tobytes()},
+)
+def _postprocess(df: pd.DataFrame) -> pd.DataFrame:
+    # Shared by both loaders: column backfill, date parse, published flag,
+    # newest-first ordering. Memoized by content hash, so each CSV version
+    # is post-processed at most once.
+    if df.empty:
+        return df
+    df = df.copy()
+    for col in CSV_COLUMNS:
         if col not in df.columns:
             df[col] = None
     try:
-        df["date"] = pd.to_datetime(df["date"], errors="coerce")
+        df["date"] = pd.to_datetime(df["date"], format="%Y-%m-%d", errors="coerce", cache=True)
     except Exception:
         pass
-    df["published"] = df["published"].astype(str).str.strip().str.lower().isin(["true", "1", "yes", "y", "oui"])
-    df = df.sort_values(["date", "edition_id"], ascending=[False, False], na_position="last").reset_index(drop=True)
+    df["published"] = _parse_published(df["published"])
+    # A handful of unique values: store lowercased categories so language
+    # filters compare integer codes instead of re-lowercasing strings.
+    df["language"] = df["language"].astype("string").str.lower().astype("category")
+    # Vectorized date strings: C-level strftime once per load instead of a
+    # Python-level strftime per rendered row.
+    try:
+        df["_date_str"] = df["date"].dt.strftime("%Y-%m-%d").fillna("")
+    except Exception:
+        df["_date_str"] = df["date"].astype(str)
+    # Combined lowercase search column: the Record filter needs one substring
+    # scan instead of two, and no per-keystroke lowercasing.
+    df["_search"] = (
+        df["title"].fillna("").astype(str) + "\n" + df["content_md"].fillna("").astype(str)
+    ).str.lower()
+    return df.sort_values(["date", "edition_id"], ascending=[False, False], na_position="last").reset_index(drop=True)
+
+def _read_parquet_snapshot(sha: Optional[str]) -> Optional[pd.DataFrame]:
+    # Parquet snapshot of the post-processed frame, valid for one CSV SHA.
+    # Lets a cold worker skip the CSV parse entirely when the file on GitHub
+    # hasn't changed. Best effort: any failure just means a normal parse.
+    if not sha or not os.path.exists(PARQUET_SNAPSHOT):
+        return None
+    try:
+        with open(PARQUET_SNAPSHOT + ".sha") as f:
+            if f.read().strip() != sha:
+                return None
+        return pd.read_parquet(PARQUET_SNAPSHOT)
+    except Exception:
+        return None
+
+def _write_parquet_snapshot(df: pd.DataFrame, sha: Optional[str]):
+    if not sha:
+        return
+    try:
+        df.to_parquet(PARQUET_SNAPSHOT, compression="zstd")
+        with open(PARQUET_SNAPSHOT + ".sha", "w") as f:
+            f.write(sha)
+    except Exception:
+        pass
+
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def fetch_editions_from_github() -> Tuple[Optional[bytes], Optional[str]]:
+    if not (GITHUB_TOKEN and GITHUB_REPO):
+        return None, None
+    content, sha = github_get_file(GITHUB_REPO, GITHUB_PATH, GITHUB_TOKEN, branch=GITHUB_BRANCH)
+    if content is None:
+        # Raise instead of returning (None, None): st.cache_data only stores
+        # what the function returns, so a transient fetch failure isn't
+        # memoized for the full 24 h TTL and the next rerun retries.
+        raise RuntimeError("could not fetch editions.csv from GitHub")
+    return content, sha
+
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def load_editions_from_github() -> Tuple[pd.DataFrame, Optional[str]]:
+    content, sha = fetch_editions_from_github()
+    snapshot = _read_parquet_snapshot(sha)
+    if snapshot is not None:
+        return snapshot, sha
+    try:
+        df = pd.read_csv(io.BytesIO(content), engine="pyarrow")
+    except Exception as e:
+        # Same as above: propagate so the parse failure isn't cached.
+        raise RuntimeError(f"failed to parse CSV from GitHub: {e}") from e
+    df = _postprocess(df)
+    _write_parquet_snapshot(df, sha)
     return df, sha
 
+@st.cache_data(show_spinner=False)
+def _load_editions_local_cached(path: str, mtime: float) -> pd.DataFrame:
+    return _postprocess(pd.read_csv(path, engine="pyarrow"))
+
 def load_editions_local() -> pd.DataFrame:
     if os.path.exists(LOCAL_CSV):
         try:
-            df = pd.read_csv(LOCAL_CSV)
-            for col in ["edition_id", "date", "language", "title", "content_md", "published"]:
-                if col not in df.columns:
-                    df[col] = None
-            try:
-                df["date"] = pd.to_datetime(df["date"], errors="coerce")
-            except Exception:
-                pass
-            df["published"] = df["published"].astype(str).str.strip().str.lower().isin(["true", "1", "yes", "y", "oui"])
-            return df.sort_values("date", ascending=False, na_position="last").reset_index(drop=True)
+            return _load_editions_local_cached(LOCAL_CSV, os.path.getmtime(LOCAL_CSV))
         except Exception as e:
             st.error(f"Failed to read local CSV: {e}")
             return pd.DataFrame()
     return pd.DataFrame()
 
-def save_editions_to_github(df: pd.DataFrame, prev_sha: Optional[str]) -> Optional[dict]:
-    csv_bytes = df.to_csv(index=False).encode("utf-8")
-    message = f"Update editions.csv — {datetime.utcnow().isoformat()}"
-    return github_put_file(GITHUB_REPO, GITHUB_PATH, GITHUB_TOKEN, csv_bytes, message, sha=prev_sha, branch=GITHUB_BRANCH)
+@st.cache_data(show_spinner=False)
+def load_latest_only(path: str, mtime: float) -> dict:
+    # Stream the CSV in chunks and keep only the newest published row per
+    # language, so Tab 1 can render without materializing the archive.
+    best: dict = {}
+    for chunk in pd.read_csv(path, chunksize=50_000):
+        chunk["date"] = _parse_dates_lenient(chunk["date"])
+        chunk["published"] = _parse_published(chunk["published"])
+        # idxmax raises on an all-NaT group, so undated rows are dropped first.
+        pub = chunk[chunk["published"] & chunk["date"].notna()]
+        if pub.empty:
+            continue
+        for lang_key, sub in pub.groupby(pub["language"].astype(str).str.lower()):
+            row = sub.loc[sub["date"].idxmax()]
+            if lang_key not in best or row["date"] > best[lang_key]["date"]:
+                best[lang_key] = row
+    return best
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_latest_preview(nbytes: int = 65536) -> dict:
+    # Lightweight Tab 1 source for GitHub mode: Range requests against
+    # raw.githubusercontent.com for the header line plus the file tail
+    # (editions are appended, so the newest rows live at the end), instead of
+    # downloading the whole archive. Returns {lang: row} like load_latest_only.
+    if not (GITHUB_TOKEN and GITHUB_REPO):
+        return {}
+    url = f"https://raw.githubusercontent.com/{GITHUB_REPO}/{GITHUB_BRANCH}/{GITHUB_PATH}"
+    auth = {"Authorization": f"token {GITHUB_TOKEN}"}
+    s = _gh_session()
+    try:
+        head = s.get(url, headers={**auth, "Range": "bytes=0-1023"}, timeout=10)
+        tail = s.get(url, headers={**auth, "Range": f"bytes=-{nbytes}"}, timeout=10)
+        if head.status_code not in (200, 206) or tail.status_code not in (200, 206):
+            return {}
+        header_line = head.content.split(b"\n", 1)[0]
+        body = tail.content
+        if tail.status_code == 206 and not body.startswith(header_line):
+            # Drop the partial record at the start of the ranged tail; any
+            # remaining torn multi-line field is skipped at parse time.
+            body = body.split(b"\n", 1)[-1]
+            body = header_line + b"\n" + body
+        df = pd.read_csv(io.BytesIO(body), on_bad_lines="skip")
+        df["date"] = _parse_dates_lenient(df["date"])
+        df["published"] = _parse_published(df["published"])
+        best: dict = {}
+        # idxmax raises on an all-NaT group, so undated rows are dropped first.
+        pub = df[df["published"] & df["date"].notna()]
+        for lang_key, sub in pub.groupby(pub["language"].astype(str).str.lower()):
+            best[lang_key] = sub.loc[sub["date"].idxmax()]
+    except Exception:
+        return {}
+    return best
+
+def get_editions() -> Tuple[pd.DataFrame, Optional[str]]:
+    # Session-level cache: widget interactions rerun the whole script, but
+    # the archive only changes on save or explicit refresh, so the loaders
+    # (and their network round-trips) run once per session.
+    if st.session_state["editions_df"] is not None:
+        return st.session_state["editions_df"], st.session_state["editions_sha"]
+    if GITHUB_TOKEN and GITHUB_REPO:
+        try:
+            df, sha = load_editions_from_github()
+        except Exception as e:
+            st.error(f"Failed to load editions from GitHub: {e}")
+            return pd.DataFrame(), None
+    else:
+        df, sha = load_editions_local(), None
+    if df.empty and sha is None:
+        # Failed (or empty) load: leave session state unset so a later rerun
+        # retries the loader instead of serving the blank archive forever.
+        return df, sha
+    st.session_state["editions_df"] = df
+    st.session_state["editions_sha"] = sha
+    return df, sha
 
-def save_editions_local(df: pd.DataFrame):
-    df.to_csv(LOCAL_CSV, index=False)
+LOGO_PATH = "assets/logo.png"
+
+def _compress_logo(uploaded_file) -> bytes:
+    # Bound the logo to 512x512 and re-encode as optimized PNG: typical
+    # uploads shrink by an order of magnitude before the base64 + PUT.
+    from PIL import Image
+
+    im = Image.open(uploaded_file)
+    im.thumbnail((512, 512))
+    buf = io.BytesIO()
+    im.save(buf, "PNG", optimize=True)
+    return buf.getvalue()
+
+def upload_logo(img_bytes: bytes) -> Optional[dict]:
+    # Steady state is a single PUT: the file SHA from the previous upload is
+    # kept in session state, so only the first upload (or a stale SHA) pays
+    # for an extra GET.
+    sha = st.session_state.get("logo_sha")
+    if sha is None:
+        _, sha = github_get_file(GITHUB_REPO, LOGO_PATH, GITHUB_TOKEN, branch=GITHUB_BRANCH)
+    message = f"Update logo — {datetime.utcnow().isoformat()}"
+    res = github_put_file(GITHUB_REPO, LOGO_PATH, GITHUB_TOKEN, img_bytes, message, sha=sha, branch=GITHUB_BRANCH)
+    if res is None and st.session_state.get("logo_sha"):
+        # The cached SHA went stale (file changed outside this session):
+        # refresh it once and retry.
+        st.session_state["logo_sha"] = None
+        _, sha = github_get_file(GITHUB_REPO, LOGO_PATH, GITHUB_TOKEN, branch=GITHUB_BRANCH)
+        res = github_put_file(GITHUB_REPO, LOGO_PATH, GITHUB_TOKEN, img_bytes, message, sha=sha, branch=GITHUB_BRANCH)
+    if res:
+        st.session_state["logo_sha"] = res.get("content", {}).get("sha")
+        get_logo_url.clear()
+    return res
+
+def _edition_csv_line(row: dict) -> str:
+    buf = io.StringIO()
+    csv.writer(buf, lineterminator="\n").writerow([row[c] for c in CSV_COLUMNS])
+    return buf.getvalue()
+
+def append_edition_local(row: dict):
+    write_header = not os.path.exists(LOCAL_CSV) or os.path.getsize(LOCAL_CSV) == 0
+    with open(LOCAL_CSV, "a", newline="", encoding="utf-8") as f:
+        if write_header:
+            f.write(",".join(CSV_COLUMNS) + "\n")
+        f.write(_edition_csv_line(row))
+
+@st.cache_data(show_spinner=False)
+def _export_csv_bytes(df_key: tuple, _df: pd.DataFrame) -> bytes:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    buf = pa.BufferOutputStream()
+    pacsv.write_csv(pa.Table.from_pandas(_df, preserve_index=False), buf)
+    return buf.getvalue().to_pybytes()
+
+def append_edition_to_github(row: dict) -> Optional[str]:
+    # Fetch the file's current state at save time rather than appending to
+    # the (up to a day old) cached copy: a Git Data commit built on stale
+    # content would silently revert rows pushed since the cache fill. The
+    # ETag path makes this a cheap 304 when nothing actually changed.
+    content, _ = github_get_file(GITHUB_REPO, GITHUB_PATH, GITHUB_TOKEN, branch=GITHUB_BRANCH)
+    line = _edition_csv_line(row).encode("utf-8")
+    if content:
+        csv_bytes = content if content.endswith(b"\n") else content + b"\n"
+        csv_bytes += line
+    else:
+        csv_bytes = (",".join(CSV_COLUMNS) + "\n").encode("utf-8") + line
+    message = f"Update editions.csv — {datetime.utcnow().isoformat()}"
+    return github_commit_file(GITHUB_REPO, GITHUB_PATH, GITHUB_TOKEN, csv_bytes, message, branch=GITHUB_BRANCH)
 
 # ----------------------------- SIDEBAR --------------------------------------
 with st.sidebar:
@@ -202,7 +522,10 @@ with st.sidebar:
     )
 
     if st.button("Refresh data", use_container_width=True, key="refresh_button"):
+        fetch_editions_from_github.clear()
         load_editions_from_github.clear()
+        st.session_state["editions_df"] = None
+        st.session_state["editions_sha"] = None
 
     if st.button("⚙️", key="admin_icon"):
         st.session_state["show_admin_login"] = not st.session_state["show_admin_login"]
@@ -211,7 +534,9 @@ with st.sidebar:
         with st.expander("Admin login", expanded=True):
             st.text_input("Enter admin password:", type="password", key="pw_input")
             if st.button("Login", key="login_btn"):
-                if ADMIN_PASSWORD and st.session_state.get("pw_input") == ADMIN_PASSWORD:
+                if ADMIN_PASSWORD and hmac.compare_digest(
+                    st.session_state.get("pw_input", "").encode("utf-8"), ADMIN_PASSWORD.encode("utf-8")
+                ):
                     st.session_state["is_admin"] = True
                     st.session_state["show_admin_login"] = False
                     st.success("Admin mode enabled")
@@ -299,23 +624,33 @@ if LOGO_URL:
         unsafe_allow_html=True
     )
 # ----------------------------- LOAD DATA ------------------------------------
+df, gh_sha = get_editions()
 if GITHUB_TOKEN and GITHUB_REPO:
-    df, gh_sha = load_editions_from_github()
     source = f"GitHub: {GITHUB_REPO}/{GITHUB_PATH} (branch: {GITHUB_BRANCH})"
 else:
-    df = load_editions_local()
-    gh_sha = None
     source = f"Local file: {LOCAL_CSV}"
 
-st.caption(f"{I18N[lang]['last_sync']}: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+# One dict lookup for the selected language instead of one per access.
+T = I18N[lang]
+
+st.caption(f"{T['last_sync']}: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
 # ----------------------------- TABS: VIEW / ADMIN / RECORD -------------------
-if not st.session_state["is_admin"] and ADMIN_PASSWORD and st.session_state.get("pw_input") == ADMIN_PASSWORD:
-    st.session_state["is_admin"] = True
+pw_input = st.session_state.get("pw_input", "")
+if (
+    not st.session_state["is_admin"]
+    and ADMIN_PASSWORD
+    and st.session_state.get("_pw_checked") != pw_input
+):
+    # Re-check only when the input actually changed; compare in constant time.
+    st.session_state["_pw_checked"] = pw_input
+    # Compare bytes: compare_digest rejects non-ASCII str inputs.
+    if hmac.compare_digest(pw_input.encode("utf-8"), ADMIN_PASSWORD.encode("utf-8")):
+        st.session_state["is_admin"] = True
 
 admin_visible = st.session_state["is_admin"]
 
-tab_labels = [I18N[lang]['latest']]
+tab_labels = [T['latest']]
 if admin_visible:
     tab_labels.append("Admin")
 tab_labels.append("Record")
@@ -323,155 +658,242 @@ tab_labels.append("Record")
 tabs = st.tabs(tab_labels)
 
 # ---------- TAB 1: Latest (read-only) -------------------------------------
+_SMART_QUOTES = str.maketrans({"’": "'", "“": '"', "”": '"'})
+
+@st.cache_data(show_spinner=False)
+def _render_latest_html(edition_id: str, _content_md: str) -> str:
+    # Keyed on edition_id: bodies are immutable once saved, so the cleanup
+    # runs once per edition instead of once per rerun.
+    content = str(_content_md).translate(_SMART_QUOTES)
+    return f"""
+    <div style="background-color:#f3f4f6; padding:1rem; border-radius:10px; color:#111827;">
+        {content}
+    </div>
+    """
+
 with tabs[0]:
-    st.subheader(I18N[lang]["latest"])
-    if df.empty:
-        st.info(I18N[lang]["empty"])
-    else:
-        dfx = df[(df["published"] == True) & (df["language"].str.lower() == lang)].copy()
-        if dfx.empty:
-            st.info(I18N[lang]["empty"])
-        else:
+    st.subheader(T["latest"])
+    latest = None
+    if not df.empty:
+        # Boolean indexing already yields an independent frame; no copy needed.
+        dfx = df[(df["published"] == True) & (df["language"] == lang)]
+        if not dfx.empty:
             latest = dfx.iloc[0]
-            c1, c2 = st.columns([3, 1])
-            with c1:
-                st.markdown(f"<span class='badge'>{latest['language'].upper()}</span>", unsafe_allow_html=True)
-                st.markdown(f"## {latest['title']}")
-                if pd.notna(latest.get("date")):
-                    st.markdown(f"<div class='meta'>{latest['date'].strftime('%Y-%m-%d')}</div>", unsafe_allow_html=True)
-                content = latest.get("content_md", "")
-                content = content.replace("’", "'").replace("“", '"').replace("”", '"')
-                st.markdown(
-                    f"""
-                    <div style="background-color:#f3f4f6; padding:1rem; border-radius:10px; color:#111827;">
-                        {content}
-                    </div>
-                    """,
-                    unsafe_allow_html=True
-                )
-                st.markdown(
-                    f"""
-                    <div style="text-align:center; margin-top:1rem;">
-                        <img src="https://raw.githubusercontent.com/Ozzors/Leparinordique/main/assets/Screenshot%202025-09-05%20135650.png"
-                             style="max-width:50%; border-radius:12px;">
-                    </div>
-                    """,
-                    unsafe_allow_html=True
-                )
-            with c2:
-                st.metric(I18N[lang]["published"], "✅")
+    elif GITHUB_TOKEN and GITHUB_REPO:
+        # Full frame unavailable (fetch or parse failed): a ranged fetch of
+        # the CSV tail is enough to show the newest published edition.
+        latest = load_latest_preview().get(lang)
+    elif os.path.exists(LOCAL_CSV):
+        # Full frame unavailable (e.g. parse failure on a huge archive):
+        # stream just the newest published row for this language. Best
+        # effort — if this parse fails too, fall through to the empty state.
+        try:
+            latest = load_latest_only(LOCAL_CSV, os.path.getmtime(LOCAL_CSV)).get(lang)
+        except Exception:
+            latest = None
+    if latest is None:
+        st.info(T["empty"])
+    else:
+        c1, c2 = st.columns([3, 1])
+        with c1:
+            st.markdown(f"<span class='badge'>{latest['language'].upper()}</span>", unsafe_allow_html=True)
+            st.markdown(f"## {latest['title']}")
+            date_str = latest.get("_date_str") or (
+                latest["date"].strftime("%Y-%m-%d") if pd.notna(latest.get("date")) else ""
+            )
+            if date_str:
+                st.markdown(f"<div class='meta'>{date_str}</div>", unsafe_allow_html=True)
+            st.markdown(
+                _render_latest_html(str(latest["edition_id"]), latest.get("content_md", "")),
+                unsafe_allow_html=True
+            )
+            st.markdown(
+                f"""
+                <div style="text-align:center; margin-top:1rem;">
+                    <img src="https://raw.githubusercontent.com/Ozzors/Leparinordique/main/assets/Screenshot%202025-09-05%20135650.png"
+                         style="max-width:50%; border-radius:12px;">
+                </div>
+                """,
+                unsafe_allow_html=True
+            )
+        with c2:
+            st.metric(T["published"], "✅")
 
 # ---------- TAB 2: Admin (password + editor) -------------------------------
-if admin_visible:
-    with tabs[1]:
-        st.subheader("Admin — Create / Edit editions")
-        if st.session_state["admin_ask_stay"]:
-            st.success("Edition saved and uploaded to GitHub ✅")
-            st.info("Do you want to stay in admin mode?")
-            col_a, col_b = st.columns(2)
-            with col_a:
-                if st.button("Stay admin", key="stay_admin_btn"):
-                    st.session_state["admin_ask_stay"] = False
-                    st.rerun()
-            with col_b:
-                if st.button("Exit admin", key="exit_admin_btn"):
-                    st.session_state["admin_ask_stay"] = False
-                    st.session_state["is_admin"] = False
-                    if "pw_input" in st.session_state:
-                        st.session_state["pw_input"] = ""
-                    st.rerun()
-        with st.form("editor_form"):
-            col1, col2 = st.columns([1, 3])
-            with col1:
-                # <- Fecha por defecto en el admin (hoy)
-                d = st.date_input("Date", value=date.today())
-                language_field = st.selectbox("Language", options=["en", "fr"], index=0)
-                published_field = st.checkbox("Published", value=True)
-            with col2:
-                title_field = st.text_input("Title")
-                content_field = st.text_area("Content (Markdown)", height=300)
-            submitted = st.form_submit_button("Save edition")
-        if submitted:
-            edition_id = f"{d.strftime('%Y%m%d')}-{language_field}-{int(time.time())}"
-            new_row = {
-                "edition_id": edition_id,
-                "date": d.strftime("%Y-%m-%d"),
-                "language": language_field,
-                "title": title_field,
-                "content_md": content_field,
-                "published": str(bool(published_field)).upper(),
-            }
-            if df is None or df.empty:
-                new_df = pd.DataFrame([new_row])
-            else:
-                new_df = pd.concat([pd.DataFrame([new_row]), df], ignore_index=True)
-            save_editions_local(new_df)
+@st.fragment
+def _admin_panel():
+    # Fragment: typing in the editor reruns only this subtree, not the whole
+    # script (no data reload per keystroke in the text area).
+    st.subheader("Admin — Create / Edit editions")
+    if st.session_state["admin_ask_stay"]:
+        st.success("Edition saved and uploaded to GitHub ✅")
+        st.info("Do you want to stay in admin mode?")
+        col_a, col_b = st.columns(2)
+        with col_a:
+            if st.button("Stay admin", key="stay_admin_btn"):
+                st.session_state["admin_ask_stay"] = False
+                st.rerun()
+        with col_b:
+            if st.button("Exit admin", key="exit_admin_btn"):
+                st.session_state["admin_ask_stay"] = False
+                st.session_state["is_admin"] = False
+                if "pw_input" in st.session_state:
+                    st.session_state["pw_input"] = ""
+                st.rerun()
+    with st.form("editor_form"):
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            # <- Fecha por defecto en el admin (hoy)
+            d = st.date_input("Date", value=date.today())
+            language_field = st.selectbox("Language", options=["en", "fr"], index=0)
+            published_field = st.checkbox("Published", value=True)
+        with col2:
+            title_field = st.text_input("Title")
+            content_field = st.text_area("Content (Markdown)", height=300)
+        submitted = st.form_submit_button("Save edition")
+    if submitted:
+        edition_id = f"{d.strftime('%Y%m%d')}-{language_field}-{int(time.time())}"
+        new_row = {
+            "edition_id": edition_id,
+            "date": d.strftime("%Y-%m-%d"),
+            "language": language_field,
+            "title": title_field,
+            "content_md": content_field,
+            "published": str(bool(published_field)).upper(),
+        }
+        # Optimistic in-memory update: the saved row is prepended to the
+        # already-loaded frame, so no extra fetch/parse round-trip is needed.
+        new_row_df = pd.DataFrame([new_row])
+        new_row_df["date"] = pd.to_datetime(new_row_df["date"], format="%Y-%m-%d")
+        new_row_df["published"] = bool(published_field)
+        new_row_df["_search"] = f"{title_field}\n{content_field}".lower()
+        new_row_df["_date_str"] = new_row["date"]
+        # Base the update on the session-state frame, not the module-global
+        # df: after a fragment-scoped rerun only this subtree re-executes, so
+        # the global still holds the pre-save frame and a second save built on
+        # it would drop the first one.
+        base_df, _ = get_editions()
+        new_df = new_row_df if base_df.empty else pd.concat([new_row_df, base_df], ignore_index=True)
+        # Re-apply the newest-first order _postprocess guarantees: Tab 1 and
+        # the Record list both rely on it, and a back-dated edition would
+        # otherwise sit on top until the next full reload.
+        new_df = new_df.sort_values(
+            ["date", "edition_id"], ascending=[False, False], na_position="last"
+        ).reset_index(drop=True)
+        if GITHUB_TOKEN and GITHUB_REPO:
+            # GitHub is the source of truth; writing editions.csv locally too
+            # would be wasted I/O and could race with a mid-write rerun.
+            with st.spinner("Saving to GitHub..."):
+                new_sha = append_edition_to_github(new_row)
+                if new_sha:
+                    fetch_editions_from_github.clear()
+                    load_editions_from_github.clear()
+                    st.session_state["editions_df"] = new_df
+                    st.session_state["editions_sha"] = new_sha
+                    st.session_state["admin_ask_stay"] = True
+                    st.rerun(scope="fragment")
+                else:
+                    st.error("Failed to save to GitHub — check logs and secrets.")
+        else:
+            append_edition_local(new_row)
+            st.success("Edition saved locally (editions.csv).")
+            st.session_state["editions_df"] = new_df
+            st.session_state["admin_ask_stay"] = True
+            st.rerun(scope="fragment")
+    with st.expander("Logo"):
+        logo_file = st.file_uploader("Upload logo (PNG/JPG)", type=["png", "jpg", "jpeg"], key="logo_upload")
+        if logo_file is not None and st.button("Upload logo", key="logo_upload_btn"):
+            img_bytes = _compress_logo(logo_file)
+            os.makedirs("assets", exist_ok=True)
+            with open(LOGO_PATH, "wb") as f:
+                f.write(img_bytes)
             if GITHUB_TOKEN and GITHUB_REPO:
-                with st.spinner("Saving to GitHub..."):
-                    res = save_editions_to_github(new_df, gh_sha)
-                    if res:
-                        load_editions_from_github.clear()
-                        df, gh_sha = load_editions_from_github()
-                        st.session_state["admin_ask_stay"] = True
-                        st.rerun()
-                    else:
-                        st.error("Failed to save to GitHub — check logs and secrets.")
+                if upload_logo(img_bytes):
+                    st.success("Logo uploaded ✅")
             else:
-                st.success("Edition saved locally (editions.csv).")
-                st.session_state["admin_ask_stay"] = True
-                st.rerun()
+                st.success("Logo saved locally.")
+
+if admin_visible:
+    with tabs[1]:
+        _admin_panel()
 
 # ---------- TAB 3: Record (history + downloads) ----------------------------
-tab_record_index = -1 if admin_visible else 1
-with tabs[tab_record_index]:
+@st.fragment
+def _record_panel(df):
+    # Fragment: search/page/selection widgets rerun only this subtree instead
+    # of the whole script (st.tabs executes every tab body per rerun).
     st.subheader("📊 Record — All editions")
     if df.empty:
         st.info("No editions available.")
-    else:
-        q = st.text_input("Search titles/content...", value="")
-        dfa = df.copy()
-        if q:
-            ql = q.lower().strip()
-            dfa = dfa[
-                dfa["title"].astype(str).str.lower().str.contains(ql)
-                | dfa["content_md"].astype(str).str.lower().str.contains(ql)
-            ]
-        sports_emojis = ["⚽", "🏀", "🏈", "🎾", "🏐", "🏒", "🥊", "🏓"]
-        for i, (_, row) in enumerate(dfa.iterrows()):
-            emoji = sports_emojis[i % len(sports_emojis)]
-            st.markdown(
-                f"""
-                <div class="edition-card">
-                    <div class="badge">{row['language'].upper()} {emoji}</div>
-                    <h4>{emoji} {row['title']}</h4>
-                    <div class="meta">{row['date']}</div>
-                    <p>{str(row['content_md'])[:180]}...</p>
-                    <div class="meta">{'✅ Published' if row['published'] else '❌ Draft'}</div>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
-        csv_bytes = dfa.to_csv(index=False).encode("utf-8")
-        st.download_button(
-            "⬇️ Download CSV (filtered)",
-            csv_bytes,
-            file_name="editions_export.csv",
-            mime="text/csv",
+        return
+    # Form-gated search: the filter runs on submit, not on every keystroke.
+    with st.form("search_form"):
+        q = st.text_input("Search titles/content...", value=st.session_state.get("last_q", ""))
+        search_submitted = st.form_submit_button("Search")
+    if search_submitted:
+        st.session_state["last_q"] = q
+    ql = st.session_state.get("last_q", "").lower().strip()
+    dfa = df
+    if ql:
+        dfa = dfa[dfa["_search"].str.contains(ql, regex=False, na=False)]
+    page_size = 20
+    n_pages = max(1, -(-len(dfa) // page_size))
+    page = st.number_input("Page", min_value=1, max_value=n_pages, value=1, step=1)
+    dfp = dfa.iloc[(page - 1) * page_size : page * page_size]
+    sports_emojis = ["⚽", "🏀", "🏈", "🎾", "🏐", "🏒", "🥊", "🏓"]
+    if not dfp.empty:
+        emojis = pd.Series(
+            [sports_emojis[i % len(sports_emojis)] for i in range(len(dfp))],
+            index=dfp.index,
         )
-        sel = st.selectbox(
-            "Download single edition (ID)",
-            options=list(dfa["edition_id"].astype(str)),
-            index=0,
+        badges = dfp["language"].astype(str).str.upper() + " " + emojis
+        snippets = dfp["content_md"].astype(str).str.slice(0, 180)
+        status = np.where(dfp["published"], "✅ Published", "❌ Draft")
+        cards = (
+            '<div class="edition-card">'
+            + '<div class="badge">' + badges + "</div>"
+            + "<h4>" + emojis + " " + dfp["title"].astype(str) + "</h4>"
+            + '<div class="meta">' + dfp["_date_str"].astype(str) + "</div>"
+            + "<p>" + snippets + "...</p>"
+            + '<div class="meta">' + status + "</div>"
+            + "</div>"
         )
-        if sel:
-            sel_row = dfa[dfa["edition_id"].astype(str) == sel].iloc[0]
-            md_content = f"# {sel_row['title']}\n\n{sel_row['content_md']}"
-            st.download_button(
-                "⬇️ Download MD",
-                md_content,
-                file_name=f"{sel}.md",
-                mime="text/markdown",
-            )
+        st.markdown(cards.str.cat(sep="\n"), unsafe_allow_html=True)
+    # Keyed on the query plus a compact id hash: the bytes are rebuilt only
+    # when the filter or the underlying dataset actually changes.
+    df_key = (ql, len(dfa), hash(tuple(dfa["edition_id"].astype(str))))
+    csv_bytes = _export_csv_bytes(df_key, dfa.drop(columns=["_search", "_date_str"], errors="ignore"))
+    st.download_button(
+        "⬇️ Download CSV (filtered)",
+        csv_bytes,
+        file_name="editions_export.csv",
+        mime="text/csv",
+    )
+    ids = list(dfa["edition_id"].astype(str))
+    sel = st.selectbox(
+        "Download single edition (ID)",
+        options=ids,
+        index=0,
+    )
+    if sel:
+        # Rebuild the MD payload only when the selection changes (editions
+        # are immutable once saved, so the id fully identifies the content).
+        if st.session_state.get("md_cache_sel") != sel:
+            # Positional lookup instead of re-stringifying the column and
+            # scanning it with a boolean mask on every selection change.
+            sel_row = dfa.iloc[{k: i for i, k in enumerate(ids)}[sel]]
+            st.session_state["md_cache"] = f"# {sel_row['title']}\n\n{sel_row['content_md']}"
+            st.session_state["md_cache_sel"] = sel
+        st.download_button(
+            "⬇️ Download MD",
+            st.session_state["md_cache"],
+            file_name=f"{sel}.md",
+            mime="text/markdown",
+        )
+
+tab_record_index = -1 if admin_visible else 1
+with tabs[tab_record_index]:
+    _record_panel(df)
 
 # ----------------------------- FOOTER --------------------------------------
 st.caption("© " + str(datetime.now().year) + " Le Pari Nordique — Built with Streamlit")